@@ -1,8 +1,10 @@
 import os
+import sys
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+import random
+from typing import Optional, Dict, List
 from contextlib import asynccontextmanager
 import json  
 from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
@@ -19,6 +21,36 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Keys per "WHERE url IN (...)" query, kept under SQLite's default variable limit
+BATCH_QUERY_SIZE = 500
+# Rows rebuilt concurrently by aget_cached_urls_batch. Each row reads up to five
+# content files at once, so this is a row cap, not a cap on open files.
+BATCH_ROW_CONCURRENCY = 16
+
+# Columns that map onto CrawlResult fields when rebuilding cached rows
+CRAWL_RESULT_FIELDS = frozenset(CrawlResult.__annotations__)
+
+CACHE_UPSERT_SQL = """
+    INSERT INTO crawled_data (
+        url, html, cleaned_html, markdown,
+        extracted_content, success, media, links, metadata,
+        screenshot, response_headers, downloaded_files
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(url) DO UPDATE SET
+        html = excluded.html,
+        cleaned_html = excluded.cleaned_html,
+        markdown = excluded.markdown,
+        extracted_content = excluded.extracted_content,
+        success = excluded.success,
+        media = excluded.media,
+        links = excluded.links,
+        metadata = excluded.metadata,
+        screenshot = excluded.screenshot,
+        response_headers = excluded.response_headers,
+        downloaded_files = excluded.downloaded_files
+"""
+
 
 class AsyncDatabaseManager:
     def __init__(self, pool_size: int = 10, max_retries: int = 3):
@@ -31,6 +63,7 @@ class AsyncDatabaseManager:
         self.init_lock = asyncio.Lock()
         self.connection_semaphore = asyncio.Semaphore(pool_size)
         self._initialized = False
+        self._schema_verified = False
         self.version_manager = VersionManager()
         self.logger = AsyncLogger(
             log_file=os.path.join(base_directory, ".crawl4ai", "crawler_db.log"),
@@ -107,8 +140,6 @@ class AsyncDatabaseManager:
                         await self.initialize()
                         self._initialized = True
                     except Exception as e:
-                        import sys
-
                         error_context = get_error_context(sys.exc_info())
                         self.logger.error(
                             message="Database initialization failed:\n{error}\n\nContext:\n{context}\n\nTraceback:\n{traceback}",
@@ -133,36 +164,37 @@ class AsyncDatabaseManager:
                         await conn.execute("PRAGMA journal_mode = WAL")
                         await conn.execute("PRAGMA busy_timeout = 5000")
 
-                        # Verify database structure
-                        async with conn.execute(
-                            "PRAGMA table_info(crawled_data)"
-                        ) as cursor:
-                            columns = await cursor.fetchall()
-                            column_names = [col[1] for col in columns]
-                            expected_columns = {
-                                "url",
-                                "html",
-                                "cleaned_html",
-                                "markdown",
-                                "extracted_content",
-                                "success",
-                                "media",
-                                "links",
-                                "metadata",
-                                "screenshot",
-                                "response_headers",
-                                "downloaded_files",
-                            }
-                            missing_columns = expected_columns - set(column_names)
-                            if missing_columns:
-                                raise ValueError(
-                                    f"Database missing columns: {missing_columns}"
-                                )
+                        # Verify database structure once; later connections
+                        # reuse the result instead of re-reading the schema
+                        if not self._schema_verified:
+                            async with conn.execute(
+                                "PRAGMA table_info(crawled_data)"
+                            ) as cursor:
+                                columns = await cursor.fetchall()
+                                column_names = [col[1] for col in columns]
+                                expected_columns = {
+                                    "url",
+                                    "html",
+                                    "cleaned_html",
+                                    "markdown",
+                                    "extracted_content",
+                                    "success",
+                                    "media",
+                                    "links",
+                                    "metadata",
+                                    "screenshot",
+                                    "response_headers",
+                                    "downloaded_files",
+                                }
+                                missing_columns = expected_columns - set(column_names)
+                                if missing_columns:
+                                    raise ValueError(
+                                        f"Database missing columns: {missing_columns}"
+                                    )
+                            self._schema_verified = True
 
                         self.connection_pool[task_id] = conn
                     except Exception as e:
-                        import sys
-
                         error_context = get_error_context(sys.exc_info())
                         error_message = (
                             f"Unexpected error in db get_connection at line {error_context['line_no']} "
@@ -182,8 +214,6 @@ class AsyncDatabaseManager:
             yield self.connection_pool[task_id]
 
         except Exception as e:
-            import sys
-
             error_context = get_error_context(sys.exc_info())
             error_message = (
                 f"Unexpected error in db get_connection at line {error_context['line_no']} "
@@ -222,7 +252,10 @@ class AsyncDatabaseManager:
                         params={"retries": self.max_retries, "error": str(e)},
                     )
                     raise
-                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+                # Exponential backoff with equal jitter so concurrent writers
+                # retrying the same locked database don't wake up together
+                delay = 2 ** attempt
+                await asyncio.sleep(delay / 2 + random.uniform(0, delay / 2))
 
     async def ainit_db(self):
         """Initialize database schema"""
@@ -285,6 +318,78 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
+    async def _row_to_crawl_result(self, row_dict: dict) -> CrawlResult:
+        """Build a CrawlResult from a crawled_data row dict"""
+        # Load content from files using stored hashes
+        content_fields = (
+            "html",
+            "cleaned_html",
+            "markdown",
+            "extracted_content",
+            "screenshot",
+        )
+
+        async def _load(field):
+            hash_value = row_dict[field]
+            if not hash_value:
+                return ""
+            content = await self._load_content(
+                hash_value,
+                field.split("_")[0],  # Get content type from field name
+            )
+            return content or ""
+
+        # The files are independent, so read them concurrently
+        contents = await asyncio.gather(*(_load(field) for field in content_fields))
+        row_dict.update(zip(content_fields, contents))
+
+        # Parse JSON fields
+        json_fields = [
+            "media",
+            "links",
+            "metadata",
+            "response_headers",
+            "markdown",
+        ]
+        for field in json_fields:
+            try:
+                row_dict[field] = (
+                    json.loads(row_dict[field]) if row_dict[field] else {}
+                )
+            except json.JSONDecodeError:
+                # Very UGLY, never mention it to me please
+                if field == "markdown" and isinstance(row_dict[field], str):
+                    row_dict[field] = MarkdownGenerationResult(
+                        raw_markdown=row_dict[field] or "",
+                        markdown_with_citations="",
+                        references_markdown="",
+                        fit_markdown="",
+                        fit_html="",
+                    )
+                else:
+                    row_dict[field] = {}
+
+        if isinstance(row_dict["markdown"], Dict):
+            if row_dict["markdown"].get("raw_markdown"):
+                row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
+
+        # Parse downloaded_files
+        try:
+            row_dict["downloaded_files"] = (
+                json.loads(row_dict["downloaded_files"])
+                if row_dict["downloaded_files"]
+                else []
+            )
+        except json.JSONDecodeError:
+            row_dict["downloaded_files"] = []
+
+        # Remove any fields not in CrawlResult model
+        filtered_dict = {
+            k: v for k, v in row_dict.items() if k in CRAWL_RESULT_FIELDS
+        }
+        filtered_dict["markdown"] = row_dict["markdown"]
+        return CrawlResult(**filtered_dict)
+
     async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
         """Retrieve cached URL data as CrawlResult"""
 
@@ -300,72 +405,7 @@ class AsyncDatabaseManager:
                 columns = [description[0] for description in cursor.description]
                 # Create dict from row data
                 row_dict = dict(zip(columns, row))
-
-                # Load content from files using stored hashes
-                content_fields = {
-                    "html": row_dict["html"],
-                    "cleaned_html": row_dict["cleaned_html"],
-                    "markdown": row_dict["markdown"],
-                    "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
-                }
-
-                for field, hash_value in content_fields.items():
-                    if hash_value:
-                        content = await self._load_content(
-                            hash_value,
-                            field.split("_")[0],  # Get content type from field name
-                        )
-                        row_dict[field] = content or ""
-                    else:
-                        row_dict[field] = ""
-
-                # Parse JSON fields
-                json_fields = [
-                    "media",
-                    "links",
-                    "metadata",
-                    "response_headers",
-                    "markdown",
-                ]
-                for field in json_fields:
-                    try:
-                        row_dict[field] = (
-                            json.loads(row_dict[field]) if row_dict[field] else {}
-                        )
-                    except json.JSONDecodeError:
-                        # Very UGLY, never mention it to me please
-                        if field == "markdown" and isinstance(row_dict[field], str):
-                            row_dict[field] = MarkdownGenerationResult(
-                                raw_markdown=row_dict[field] or "",
-                                markdown_with_citations="",
-                                references_markdown="",
-                                fit_markdown="",
-                                fit_html="",
-                            )
-                        else:
-                            row_dict[field] = {}
-
-                if isinstance(row_dict["markdown"], Dict):
-                    if row_dict["markdown"].get("raw_markdown"):
-                        row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
-
-                # Parse downloaded_files
-                try:
-                    row_dict["downloaded_files"] = (
-                        json.loads(row_dict["downloaded_files"])
-                        if row_dict["downloaded_files"]
-                        else []
-                    )
-                except json.JSONDecodeError:
-                    row_dict["downloaded_files"] = []
-
-                # Remove any fields not in CrawlResult model
-                valid_fields = CrawlResult.__annotations__.keys()
-                filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
-                filtered_dict["markdown"] = row_dict["markdown"]
-                return CrawlResult(**filtered_dict)
+                return await self._row_to_crawl_result(row_dict)
 
         try:
             return await self.execute_with_retry(_get)
@@ -378,8 +418,69 @@ class AsyncDatabaseManager:
             )
             return None
 
-    async def acache_url(self, result: CrawlResult):
-        """Cache CrawlResult data"""
+    async def aget_cached_urls_batch(
+        self, urls: List[str]
+    ) -> List[Optional[CrawlResult]]:
+        """Retrieve several cached URLs with one query per chunk of keys.
+
+        Results are returned in the same order as ``urls``; URLs that are not
+        cached map to ``None``.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+
+        async def _get_many(db):
+            rows = {}
+            for i in range(0, len(unique_urls), BATCH_QUERY_SIZE):
+                chunk = unique_urls[i : i + BATCH_QUERY_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                async with db.execute(
+                    f"SELECT * FROM crawled_data WHERE url IN ({placeholders})",
+                    chunk,
+                ) as cursor:
+                    columns = [description[0] for description in cursor.description]
+                    for row in await cursor.fetchall():
+                        row_dict = dict(zip(columns, row))
+                        rows[row_dict["url"]] = row_dict
+            return rows
+
+        if not unique_urls:
+            return []
+
+        try:
+            rows = await self.execute_with_retry(_get_many)
+        except Exception as e:
+            self.logger.error(
+                message="Error retrieving cached URLs: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+            return [None] * len(urls)
+
+        # Rows are independent, so rebuild them concurrently while capping
+        # the number of rows in flight.
+        semaphore = asyncio.Semaphore(BATCH_ROW_CONCURRENCY)
+
+        async def _build(row_dict):
+            # A row that fails to rebuild maps to None, as in aget_cached_url
+            async with semaphore:
+                try:
+                    return await self._row_to_crawl_result(row_dict)
+                except Exception as e:
+                    self.logger.error(
+                        message="Error retrieving cached URL: {error}",
+                        tag="ERROR",
+                        force_verbose=True,
+                        params={"error": str(e)},
+                    )
+                    return None
+
+        built = await asyncio.gather(*(_build(row) for row in rows.values()))
+        results = dict(zip(rows.keys(), built))
+        return [results.get(url) for url in urls]
+
+    async def _prepare_cache_row(self, result: CrawlResult) -> tuple:
+        """Store content files for a CrawlResult and return its row values"""
         # Store content files and get hashes
         content_map = {
             "html": (result.html, "html"),
@@ -425,43 +526,27 @@ class AsyncDatabaseManager:
         for field, (content, content_type) in content_map.items():
             content_hashes[field] = await self._store_content(content, content_type)
 
+        return (
+            result.url,
+            content_hashes["html"],
+            content_hashes["cleaned_html"],
+            content_hashes["markdown"],
+            content_hashes["extracted_content"],
+            result.success,
+            json.dumps(result.media),
+            json.dumps(result.links),
+            json.dumps(result.metadata or {}),
+            content_hashes["screenshot"],
+            json.dumps(result.response_headers or {}),
+            json.dumps(result.downloaded_files or []),
+        )
+
+    async def acache_url(self, result: CrawlResult):
+        """Cache CrawlResult data"""
+        row = await self._prepare_cache_row(result)
+
         async def _cache(db):
-            await db.execute(
-                """
-                INSERT INTO crawled_data (
-                    url, html, cleaned_html, markdown,
-                    extracted_content, success, media, links, metadata,
-                    screenshot, response_headers, downloaded_files
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(url) DO UPDATE SET
-                    html = excluded.html,
-                    cleaned_html = excluded.cleaned_html,
-                    markdown = excluded.markdown,
-                    extracted_content = excluded.extracted_content,
-                    success = excluded.success,
-                    media = excluded.media,
-                    links = excluded.links,
-                    metadata = excluded.metadata,
-                    screenshot = excluded.screenshot,
-                    response_headers = excluded.response_headers,
-                    downloaded_files = excluded.downloaded_files
-            """,
-                (
-                    result.url,
-                    content_hashes["html"],
-                    content_hashes["cleaned_html"],
-                    content_hashes["markdown"],
-                    content_hashes["extracted_content"],
-                    result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
-                    content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
-                ),
-            )
+            await db.execute(CACHE_UPSERT_SQL, row)
 
         try:
             await self.execute_with_retry(_cache)
@@ -473,6 +558,26 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
+    async def acache_urls_batch(self, results: List[CrawlResult]):
+        """Cache several CrawlResults with a single multi-row write"""
+        if not results:
+            return
+
+        rows = [await self._prepare_cache_row(result) for result in results]
+
+        async def _cache_many(db):
+            await db.executemany(CACHE_UPSERT_SQL, rows)
+
+        try:
+            await self.execute_with_retry(_cache_many)
+        except Exception as e:
+            self.logger.error(
+                message="Error caching URLs: {error}",
+                tag="ERROR",
+                force_verbose=True,
+                params={"error": str(e)},
+            )
+
     async def aget_total_count(self) -> int:
         """Get total number of cached URLs"""
 
@@ -513,6 +618,7 @@ class AsyncDatabaseManager:
 
         async def _flush(db):
             await db.execute("DROP TABLE IF EXISTS crawled_data")
+            self._schema_verified = False
 
         try:
             await self.execute_with_retry(_flush)
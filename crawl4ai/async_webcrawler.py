@@ -754,6 +754,37 @@ class AsyncWebCrawler:
             _results = await dispatcher.run_urls(crawler=self, urls=urls, config=config)
             return [transform_result(res) for res in _results]
 
+    async def aget_cached_urls_batch(
+        self, urls: List[str]
+    ) -> List[Optional[CrawlResult]]:
+        """
+        Reads several URLs from the local cache in bulk, without crawling.
+
+        arun() and arun_many() still read the cache one URL at a time; use this
+        to check many URLs up front, e.g. to skip ones that are already cached.
+
+        Args:
+        urls: List of URLs to look up
+
+        Returns:
+        List[Optional[CrawlResult]]: Cached results in the same order as urls,
+            with None for URLs that are not cached
+        """
+        return await async_db_manager.aget_cached_urls_batch(urls)
+
+    async def acache_urls_batch(self, results: List[CrawlResult]):
+        """
+        Writes several results to the local cache in a single transaction.
+
+        arun() and arun_many() still write the cache one URL at a time; use this
+        to cache results gathered elsewhere, e.g. from a run with
+        CacheMode.BYPASS.
+
+        Args:
+        results: CrawlResult objects to cache, keyed by their url
+        """
+        await async_db_manager.acache_urls_batch(results)
+
     async def aseed_urls(
         self,
         domain_or_domains: Union[str, List[str]],
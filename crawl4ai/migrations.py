@@ -1,5 +1,6 @@
 import os
 import asyncio
+import argparse
 from pathlib import Path
 import aiosqlite
 from typing import Optional
@@ -12,13 +13,43 @@ from .async_logger import AsyncLogger, LogLevel
 # Initialize logger
 logger = AsyncLogger(log_level=LogLevel.DEBUG, verbose=True)
 
+# Default rows read and updated per round trip during migration. Rows carry
+# full HTML and screenshots, so this bounds peak memory as well as round trips.
+MIGRATION_BATCH_SIZE = 100
+# Rows whose content files are stored concurrently within a batch
+MIGRATION_CONCURRENCY = 10
+
+SELECT_PAGE_SQL = """
+    SELECT rowid, url, html, cleaned_html, markdown,
+           extracted_content, screenshot
+    FROM crawled_data
+    WHERE rowid > ?
+    ORDER BY rowid
+    LIMIT ?
+"""
+
+UPDATE_HASHES_SQL = """
+    UPDATE crawled_data
+    SET html = ?,
+        cleaned_html = ?,
+        markdown = ?,
+        extracted_content = ?,
+        screenshot = ?
+    WHERE url = ?
+"""
+
 # logging.basicConfig(level=logging.INFO)
 # logger = logging.getLogger(__name__)
 
 
 class DatabaseMigration:
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, batch_size: int = MIGRATION_BATCH_SIZE):
+        # LIMIT 0 would migrate nothing yet report success, and a negative
+        # LIMIT means "no limit" to SQLite
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         self.db_path = db_path
+        self.batch_size = batch_size
         self.content_paths = self._ensure_content_dirs(os.path.dirname(db_path))
 
     def _ensure_content_dirs(self, base_path: str) -> dict:
@@ -56,66 +87,78 @@ class DatabaseMigration:
 
         return content_hash
 
+    async def _migrate_row(self, row: tuple) -> tuple:
+        """Store a row's content in files and return its UPDATE parameters"""
+        (
+            _rowid,
+            url,
+            html,
+            cleaned_html,
+            markdown,
+            extracted_content,
+            screenshot,
+        ) = row
+
+        # Store content in files and get hashes
+        html_hash = await self._store_content(html, "html")
+        cleaned_hash = await self._store_content(cleaned_html, "cleaned")
+        markdown_hash = await self._store_content(markdown, "markdown")
+        extracted_hash = await self._store_content(extracted_content, "extracted")
+        screenshot_hash = await self._store_content(screenshot, "screenshots")
+
+        return (
+            html_hash,
+            cleaned_hash,
+            markdown_hash,
+            extracted_hash,
+            screenshot_hash,
+            url,
+        )
+
     async def migrate_database(self):
         """Migrate existing database to file-based storage"""
         # logger.info("Starting database migration...")
         logger.info("Starting database migration...", tag="INIT")
 
         try:
+            semaphore = asyncio.Semaphore(MIGRATION_CONCURRENCY)
+
+            async def _bounded(row):
+                async with semaphore:
+                    return await self._migrate_row(row)
+
             async with aiosqlite.connect(self.db_path) as db:
-                # Get all rows
-                async with db.execute(
-                    """SELECT url, html, cleaned_html, markdown, 
-                       extracted_content, screenshot FROM crawled_data"""
-                ) as cursor:
-                    rows = await cursor.fetchall()
+                # Bulk pass: larger page cache (64 MiB) and in-memory temp
+                # storage for this connection only
+                await db.execute("PRAGMA cache_size = -65536")
+                await db.execute("PRAGMA temp_store = MEMORY")
 
                 migrated_count = 0
-                for row in rows:
-                    (
-                        url,
-                        html,
-                        cleaned_html,
-                        markdown,
-                        extracted_content,
-                        screenshot,
-                    ) = row
-
-                    # Store content in files and get hashes
-                    html_hash = await self._store_content(html, "html")
-                    cleaned_hash = await self._store_content(cleaned_html, "cleaned")
-                    markdown_hash = await self._store_content(markdown, "markdown")
-                    extracted_hash = await self._store_content(
-                        extracted_content, "extracted"
-                    )
-                    screenshot_hash = await self._store_content(
-                        screenshot, "screenshots"
-                    )
-
-                    # Update database with hashes
-                    await db.execute(
-                        """
-                        UPDATE crawled_data 
-                        SET html = ?, 
-                            cleaned_html = ?,
-                            markdown = ?,
-                            extracted_content = ?,
-                            screenshot = ?
-                        WHERE url = ?
-                    """,
-                        (
-                            html_hash,
-                            cleaned_hash,
-                            markdown_hash,
-                            extracted_hash,
-                            screenshot_hash,
-                            url,
-                        ),
-                    )
-
-                    migrated_count += 1
-                    if migrated_count % 100 == 0:
-                        logger.info(f"Migrated {migrated_count} records...", tag="INIT")
+                last_rowid = 0
+                while True:
+                    # Page through rows by rowid so only one batch of content
+                    # is in memory and no read cursor is open during updates
+                    async with db.execute(
+                        SELECT_PAGE_SQL, (last_rowid, self.batch_size)
+                    ) as cursor:
+                        rows = await cursor.fetchall()
+                    if not rows:
+                        break
+                    last_rowid = rows[-1][0]
+                    migrated_count += len(rows)
+
+                    # Rows without any content have nothing to move to files
+                    rows = [row for row in rows if any(row[2:])]
+                    if not rows:
+                        continue
+
+                    # Content files for different rows are independent, so
+                    # store them concurrently while capping open files
+                    updates = await asyncio.gather(*(_bounded(row) for row in rows))
+
+                    # Update database with hashes, one statement per batch
+                    await db.executemany(UPDATE_HASHES_SQL, updates)
+                    logger.info(f"Migrated {migrated_count} records...", tag="INIT")
 
                 await db.commit()
                 logger.success(
@@ -159,7 +202,9 @@ async def backup_database(db_path: str) -> str:
         raise e
 
 
-async def run_migration(db_path: Optional[str] = None):
+async def run_migration(
+    db_path: Optional[str] = None, batch_size: int = MIGRATION_BATCH_SIZE
+):
     """Run database migration"""
     if db_path is None:
         db_path = os.path.join(Path.home(), ".crawl4ai", "crawl4ai.db")
@@ -173,21 +218,33 @@ async def run_migration(db_path: Optional[str] = None):
     if not backup_path:
         return
 
-    migration = DatabaseMigration(db_path)
+    migration = DatabaseMigration(db_path, batch_size=batch_size)
     await migration.migrate_database()
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for integers >= 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """CLI entry point for migration"""
-    import argparse
-
     parser = argparse.ArgumentParser(
         description="Migrate Crawl4AI database to file-based storage"
     )
     parser.add_argument("--db-path", help="Custom database path")
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=MIGRATION_BATCH_SIZE,
+        help="Rows read and updated per batch",
+    )
     args = parser.parse_args()
 
-    asyncio.run(run_migration(args.db_path))
+    asyncio.run(run_migration(args.db_path, batch_size=args.batch_size))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import os
 import sys
+import aiosqlite
 import pytest
 
 # Add the parent directory to the Python path
@@ -7,6 +8,31 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(parent_dir)
 
 from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.utils import ensure_content_dirs
+
+
+@pytest.fixture
+def temp_db_manager(tmp_path):
+    """AsyncDatabaseManager backed by a throwaway database and content store"""
+    manager = AsyncDatabaseManager()
+    manager.db_path = str(tmp_path / "crawl4ai.db")
+    manager.content_paths = ensure_content_dirs(str(tmp_path))
+    # Skip initialize(): it runs version migrations against the default database
+    manager._initialized = True
+    return manager
+
+
+def make_result(url: str, html: str) -> CrawlResult:
+    """Build a CrawlResult shaped like arun's output without crawling"""
+    result = CrawlResult(url=url, html=html, success=True)
+    result.markdown = MarkdownGenerationResult(
+        raw_markdown=html,
+        markdown_with_citations=html,
+        references_markdown="",
+    )
+    return result
 
 
 @pytest.mark.asyncio
@@ -85,6 +111,52 @@ async def test_flush_cache():
         )  # The crawler should still succeed, but it will fetch the content anew
 
 
+@pytest.mark.asyncio
+async def test_cached_urls_batch(temp_db_manager):
+    await temp_db_manager.ainit_db()
+    url = "https://www.example.com"
+    await temp_db_manager.acache_url(make_result(url, "<html>cached</html>"))
+
+    missing_url = "https://www.example.com/not-cached"
+    results = await temp_db_manager.aget_cached_urls_batch([missing_url, url, url])
+    assert len(results) == 3
+    assert results[0] is None
+    assert results[1].url == url
+    assert results[1].html == "<html>cached</html>"
+    assert results[2].url == url
+
+
+@pytest.mark.asyncio
+async def test_cached_urls_batch_invalid_row(temp_db_manager):
+    await temp_db_manager.ainit_db()
+    url = "https://www.example.com"
+    await temp_db_manager.acache_url(make_result(url, "<html>cached</html>"))
+    # A row CrawlResult cannot validate (NULL success) maps to None
+    bad_url = "https://www.example.com/bad"
+    async with aiosqlite.connect(temp_db_manager.db_path) as db:
+        await db.execute(
+            "INSERT INTO crawled_data (url, success) VALUES (?, NULL)", (bad_url,)
+        )
+        await db.commit()
+
+    assert await temp_db_manager.aget_cached_url(bad_url) is None
+    results = await temp_db_manager.aget_cached_urls_batch([bad_url, url])
+    assert results[0] is None
+    assert results[1].url == url
+
+
+@pytest.mark.asyncio
+async def test_cache_urls_batch(temp_db_manager):
+    await temp_db_manager.ainit_db()
+    urls = ["https://www.example.com", "https://www.example.org"]
+    results = [make_result(url, f"<html>{url}</html>") for url in urls]
+
+    await temp_db_manager.acache_urls_batch(results)
+    cached = await temp_db_manager.aget_cached_urls_batch(urls)
+    assert [r.url for r in cached] == urls
+    assert [r.html for r in cached] == [r.html for r in results]
+
+
 # Entry point for debugging
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
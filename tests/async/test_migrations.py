@@ -0,0 +1,92 @@
+import os
+import sys
+import aiosqlite
+import pytest
+
+# Add the parent directory to the Python path
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(parent_dir)
+
+from crawl4ai.migrations import DatabaseMigration
+
+CONTENT_TYPES = ("html", "cleaned", "markdown", "extracted", "screenshots")
+
+
+async def create_legacy_db(db_path: str, rows: list):
+    """Create a crawled_data table holding inline content, as before migration"""
+    async with aiosqlite.connect(db_path) as db:
+        await db.execute(
+            """
+            CREATE TABLE crawled_data (
+                url TEXT PRIMARY KEY,
+                html TEXT,
+                cleaned_html TEXT,
+                markdown TEXT,
+                extracted_content TEXT,
+                screenshot TEXT
+            )
+        """
+        )
+        await db.executemany(
+            "INSERT INTO crawled_data VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        await db.commit()
+
+
+async def read_rows(db_path: str) -> dict:
+    async with aiosqlite.connect(db_path) as db:
+        async with db.execute(
+            "SELECT url, html, cleaned_html, markdown, extracted_content, screenshot "
+            "FROM crawled_data"
+        ) as cursor:
+            return {row[0]: row[1:] for row in await cursor.fetchall()}
+
+
+@pytest.mark.asyncio
+async def test_migrate_database_across_batches(tmp_path):
+    db_path = str(tmp_path / "crawl4ai.db")
+    rows = [
+        (
+            f"https://example.com/{i}",
+            f"<html>{i}</html>",
+            f"<p>{i}</p>",
+            f"# {i}",
+            f"[{i}]",
+            f"shot-{i}",
+        )
+        for i in range(5)
+    ]
+    # A row without content sits between two batches' worth of rows
+    empty_row = ("https://example.com/empty", None, "", None, "", None)
+    rows.insert(2, empty_row)
+    await create_legacy_db(db_path, rows)
+
+    # batch_size=2 forces several pages, including a partial last one
+    migration = DatabaseMigration(db_path, batch_size=2)
+    await migration.migrate_database()
+
+    migrated = await read_rows(db_path)
+    assert migrated[empty_row[0]] == empty_row[1:]
+
+    for url, *contents in rows:
+        if url == empty_row[0]:
+            continue
+        hashes = migrated[url]
+        for content, content_hash, content_type in zip(
+            contents, hashes, CONTENT_TYPES
+        ):
+            assert content_hash == migration._generate_content_hash(content)
+            file_path = os.path.join(migration.content_paths[content_type], content_hash)
+            with open(file_path, encoding="utf-8") as f:
+                assert f.read() == content
+
+
+@pytest.mark.parametrize("batch_size", [0, -1])
+def test_migration_rejects_non_positive_batch_size(tmp_path, batch_size):
+    with pytest.raises(ValueError):
+        DatabaseMigration(str(tmp_path / "crawl4ai.db"), batch_size=batch_size)
+
+
+# Entry point for debugging
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -14,9 +14,9 @@ from crawl4ai.async_webcrawler import AsyncWebCrawler
 async def test_crawl_speed():
     async with AsyncWebCrawler(verbose=True) as crawler:
         url = "https://www.nbcnews.com/business"
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = await crawler.arun(url=url, bypass_cache=True)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         assert result.success
         crawl_time = end_time - start_time
@@ -36,9 +36,9 @@ async def test_concurrent_crawling_performance():
             "https://www.stackoverflow.com",
         ]
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = await crawler.arun_many(urls=urls, bypass_cache=True)
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         total_time = end_time - start_time
         print(f"Total time for concurrent crawling: {total_time:.2f} seconds")
@@ -56,14 +56,14 @@ async def test_crawl_speed_with_caching():
     async with AsyncWebCrawler(verbose=True) as crawler:
         url = "https://www.nbcnews.com/business"
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result1 = await crawler.arun(url=url, bypass_cache=True)
-        end_time = time.time()
+        end_time = time.perf_counter()
         first_crawl_time = end_time - start_time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         result2 = await crawler.arun(url=url, bypass_cache=False)
-        end_time = time.time()
+        end_time = time.perf_counter()
         second_crawl_time = end_time - start_time
 
         assert result1.success and result2.success